@@ -22,6 +22,9 @@ IRC_REALNAME = "Topic Monitor Bot"
 #   "🟢" - emoji-based status indicators work too
 TRIGGER_PHRASE = "ONLINE"
 
+# Additional phrases that also trigger (optional, default: none)
+# TRIGGER_PHRASES = ["BACK UP", "🟢"]
+
 # Case-sensitive matching (default: True)
 # Set to False if you want "online", "ONLINE", and "Online" to all trigger
 TRIGGER_CASE_SENSITIVE = True
@@ -20,16 +20,24 @@ from __future__ import annotations
 __version__ = "1.0.0"
 
 import argparse
+import atexit
+import functools
 import logging
+import logging.handlers
+import queue
+import random
+import re
 import signal
+import socket
 import ssl
 import sys
 import threading
 import time
-from datetime import datetime, timedelta
-from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import NamedTuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from irc.bot import SingleServerIRCBot
 from irc.connection import Factory
 
@@ -50,6 +58,10 @@ try:
         from config import TRIGGER_CASE_SENSITIVE
     except ImportError:
         TRIGGER_CASE_SENSITIVE = True
+    try:
+        from config import TRIGGER_PHRASES
+    except ImportError:
+        TRIGGER_PHRASES = []
     try:
         from config import HEALTH_PORT
     except ImportError:
@@ -63,28 +75,93 @@ except ImportError:
 # Logging Setup
 # =============================================================================
 
+# Records go through a queue; a background listener does the formatting
+# and stderr writes, keeping that I/O off the IRC thread
+_log_queue: queue.Queue = queue.Queue(-1)
+_log_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_log_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+_log_stream_handler = logging.StreamHandler()
+_log_stream_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_stream_handler)
+
 logging.basicConfig(
     level=getattr(logging, LOG_LEVEL, logging.INFO),
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[logging.StreamHandler()]
+    handlers=[_log_queue_handler]
 )
+# basicConfig is a no-op if logging was already configured by the importer
+if _log_queue_handler in logging.getLogger().handlers:
+    _log_listener.start()
+    atexit.register(_log_listener.stop)  # Flush queued records on exit
 logger = logging.getLogger(__name__)
 
-# Global state for health checks
-_bot_status: dict[str, any] = {"connected": False, "channel_joined": False}
+# Reconnect backoff bounds (seconds) for the restart loop in main()
+RECONNECT_BACKOFF_MIN = 1.0
+RECONNECT_BACKOFF_MAX = 300.0
+
+# Quiet period before a changed topic is checked, so a burst of edits
+# is evaluated once using the final topic
+TOPIC_DEBOUNCE_SECONDS = 0.5
+
+# Client-side Pushover rate limit: burst size and steady-state refill
+PUSHOVER_RATE_LIMIT_BURST = 5
+PUSHOVER_RATE_LIMIT_PER_MINUTE = 1.0
+
+# Max notifications waiting for the sender thread before new ones are dropped
+NOTIFY_QUEUE_SIZE = 16
+
+# Fallback wait when Pushover returns 429 without a usable Retry-After,
+# and the longest Retry-After honoured before sending resumes
+PUSHOVER_RETRY_AFTER_DEFAULT = 60.0
+PUSHOVER_RETRY_AFTER_MAX = 3600.0
+
+# Modern SSL context with proper hostname verification. Built once: loading
+# the system CA bundle is slow and the context is safe to share.
+_SSL_CONTEXT = ssl.create_default_context()
+
+# Shared HTTP session so repeat notifications reuse the TLS connection
+_SESSION = requests.Session()
+_SESSION.headers.update({"User-Agent": f"irc-topic-notify/{__version__}"})
+# Retry only failed connects: nothing was sent yet, so a POST can't be duplicated
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=2,
+    max_retries=Retry(total=2, connect=2, read=0, status=0, backoff_factor=0.5),
+))
+
+PUSHOVER_API_URL = "https://api.pushover.net/1/messages.json"
+
+# URL, headers and auth are prepared once; each send only fills in the body.
+# Environment settings (proxies, CA bundle) are resolved once for the same reason.
+_PUSHOVER_REQUEST = _SESSION.prepare_request(requests.Request("POST", PUSHOVER_API_URL))
+_PUSHOVER_SEND_SETTINGS = _SESSION.merge_environment_settings(
+    PUSHOVER_API_URL, {}, None, None, None
+)
+
+# Global state for health checks: set on the IRC thread, read by the health server
+_connected_event = threading.Event()
+_channel_joined_event = threading.Event()
 
 # =============================================================================
 # Utility Functions
 # =============================================================================
 
+# Marker used by the placeholder values in config.example.py
+_PLACEHOLDER_RE = re.compile(r"your-", re.IGNORECASE)
+
+
+def _is_placeholder(value: str) -> bool:
+    """Check if a config value is unset or still the example placeholder."""
+    return not value or _PLACEHOLDER_RE.search(value) is not None
+
+
 def validate_config() -> None:
     """Validate configuration before starting."""
     errors: list[str] = []
     
-    if not PUSHOVER_APP_TOKEN or 'your-' in PUSHOVER_APP_TOKEN.lower():
+    if _is_placeholder(PUSHOVER_APP_TOKEN):
         errors.append("PUSHOVER_APP_TOKEN not configured")
     
-    if not PUSHOVER_USER_KEY or 'your-' in PUSHOVER_USER_KEY.lower():
+    if _is_placeholder(PUSHOVER_USER_KEY):
         errors.append("PUSHOVER_USER_KEY not configured")
     
     if not IRC_SERVER:
@@ -93,6 +170,12 @@ def validate_config() -> None:
     if not IRC_CHANNEL or not IRC_CHANNEL.startswith('#'):
         errors.append("IRC_CHANNEL must start with #")
     
+    # A bare string would be split into single-character phrases
+    if not isinstance(TRIGGER_PHRASES, (list, tuple)):
+        errors.append("TRIGGER_PHRASES must be a list of phrases")
+    elif not all(isinstance(p, str) and p for p in TRIGGER_PHRASES):
+        errors.append("TRIGGER_PHRASES entries must be non-empty strings")
+    
     if errors:
         for e in errors:
             logger.error(f"Config error: {e}")
@@ -102,81 +185,318 @@ def validate_config() -> None:
     logger.debug("Configuration validated successfully")
 
 
+class _TokenBucket:
+    """Token bucket admitting short bursts, then a steady request rate."""
+
+    def __init__(self, capacity: int, refill_per_second: float) -> None:
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> bool:
+        """Take one token if available. Never blocks."""
+        with self._lock:
+            now = time.monotonic()
+            if now < self.paused_until:
+                return False
+            elapsed = now - self.updated
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_per_second)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            return False
+
+    def pause(self, seconds: float) -> None:
+        """Refuse all tokens for the next `seconds` (e.g. after a 429)."""
+        with self._lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+    def wait_seconds(self) -> float:
+        """Seconds until try_acquire() can next succeed (0 if it can now)."""
+        with self._lock:
+            now = time.monotonic()
+            tokens = min(self.capacity, self.tokens + (now - self.updated) * self.refill_per_second)
+            refill = max(1 - tokens, 0.0) / self.refill_per_second
+            return max(self.paused_until - now, refill, 0.0)
+
+
+_pushover_bucket = _TokenBucket(PUSHOVER_RATE_LIMIT_BURST, PUSHOVER_RATE_LIMIT_PER_MINUTE / 60)
+
+
+class _RateLimited(Exception):
+    """Pushover sends are paused or out of tokens; retry after `retry_after` seconds."""
+
+    def __init__(self, retry_after: float) -> None:
+        super().__init__(f"rate limited, retry after {retry_after:.0f}s")
+        self.retry_after = retry_after
+
+
+def _parse_retry_after(value: str | None) -> float:
+    """Parse a Retry-After header given in seconds, capped at PUSHOVER_RETRY_AFTER_MAX."""
+    try:
+        seconds = float(value)
+    except (TypeError, ValueError):
+        return PUSHOVER_RETRY_AFTER_DEFAULT
+    if seconds != seconds:  # NaN
+        return PUSHOVER_RETRY_AFTER_DEFAULT
+    return min(max(seconds, 0.0), PUSHOVER_RETRY_AFTER_MAX)
+
+
+# Per-mode Pushover fields (normal priority for tests)
+_PUSHOVER_TEST_EXTRA = {"priority": 0, "sound": "pushover"}
+_PUSHOVER_ALERT_EXTRA = {"priority": 1, "sound": "persistent"}
+
+
+def _build_pushover_payload() -> None:
+    """Precompute the Pushover fields that are the same for every send."""
+    global _PUSHOVER_BASE_DATA
+    _PUSHOVER_BASE_DATA = {
+        "token": PUSHOVER_APP_TOKEN,
+        "user": PUSHOVER_USER_KEY,
+        "url": NOTIFICATION_URL,
+        "url_title": NOTIFICATION_URL_TITLE,
+    }
+
+
+_build_pushover_payload()
+
+# Single-flight guard: at most one Pushover request in progress at a time
+_notify_lock = threading.Lock()
+
+
 def send_pushover_notification(
     title: str | None = None,
     message: str | None = None,
     test: bool = False,
 ) -> bool:
-    """Send Pushover notification. Returns True on success."""
+    """Send Pushover notification. Returns True on success.
+
+    If another send is already in flight, returns False immediately
+    rather than posting a duplicate.
+    """
     try:
-        r = requests.post(
-            "https://api.pushover.net/1/messages.json",
-            data={
-                "token": PUSHOVER_APP_TOKEN,
-                "user": PUSHOVER_USER_KEY,
-                "message": message or NOTIFICATION_MESSAGE,
-                "title": title or NOTIFICATION_TITLE,
-                "priority": 0 if test else 1,  # Normal priority for tests
-                "sound": "pushover" if test else "persistent",
-                "url": NOTIFICATION_URL,
-                "url_title": NOTIFICATION_URL_TITLE,
-            },
-            timeout=30
+        return _send_pushover(title, message, test)
+    except _RateLimited:
+        return False
+
+
+def _send_pushover(title: str | None, message: str | None, test: bool) -> bool:
+    """Like send_pushover_notification, but raises _RateLimited so the caller can retry."""
+    if not _notify_lock.acquire(blocking=False):
+        logger.warning("Pushover notification already in flight, skipping duplicate")
+        return False
+    try:
+        return _post_pushover(title, message, test)
+    finally:
+        _notify_lock.release()
+
+
+def _post_pushover(title: str | None, message: str | None, test: bool) -> bool:
+    """POST one message to the Pushover API. Caller holds _notify_lock."""
+    if not _pushover_bucket.try_acquire():
+        logger.warning("Pushover rate limited locally, notification not sent")
+        raise _RateLimited(_pushover_bucket.wait_seconds())
+    try:
+        prepared = _PUSHOVER_REQUEST.copy()
+        prepared.prepare_body(data={
+            **_PUSHOVER_BASE_DATA,
+            "message": message or NOTIFICATION_MESSAGE,
+            "title": title or NOTIFICATION_TITLE,
+            **(_PUSHOVER_TEST_EXTRA if test else _PUSHOVER_ALERT_EXTRA),
+        }, files=None)
+        r = _SESSION.send(
+            prepared,
+            timeout=(5, 30),  # (connect, read)
+            **_PUSHOVER_SEND_SETTINGS,
         )
         if r.status_code == 200:
             logger.info("✅ Pushover notification sent!")
             return True
+        elif r.status_code == 429:
+            # Honour the server's backoff instead of hammering it
+            retry_after = _parse_retry_after(r.headers.get("Retry-After"))
+            _pushover_bucket.pause(retry_after)
+            logger.error(f"Pushover rate limit hit, pausing sends for {retry_after:.0f}s")
+            raise _RateLimited(retry_after)
         else:
             logger.error(f"Pushover error: {r.status_code} - {r.text}")
             return False
+    except _RateLimited:
+        raise
     except Exception as e:
         logger.error(f"Pushover error: {e}")
         return False
 
 
+# Notification jobs handed from the IRC thread to the sender thread, so a
+# slow Pushover response can't stall PING/PONG handling
+_notify_queue: queue.Queue = queue.Queue(maxsize=NOTIFY_QUEUE_SIZE)
+
+
+def _notification_worker() -> None:
+    """Run queued notification jobs one at a time, forever."""
+    while True:
+        job = _notify_queue.get()
+        try:
+            job()
+        except Exception as e:
+            logger.error(f"Notification job failed: {e}")
+        finally:
+            _notify_queue.task_done()
+
+
+def start_notification_worker() -> threading.Thread:
+    """Start the notification sender in a background thread."""
+    thread = threading.Thread(target=_notification_worker, name="notify", daemon=True)
+    thread.start()
+    return thread
+
+
+class _TriggerSet(NamedTuple):
+    """Precomputed trigger needles. Hashable, so it can key the match cache."""
+
+    phrases: tuple[str, ...]
+    folded: tuple[str, ...]
+    min_len: int
+
+
+def _extra_trigger_phrases() -> list[str]:
+    """Usable TRIGGER_PHRASES entries.
+
+    Runs at import, before validate_config, so malformed values are
+    skipped here rather than raising; validate_config reports them.
+    """
+    if not isinstance(TRIGGER_PHRASES, (list, tuple)):
+        return []
+    return [p for p in TRIGGER_PHRASES if isinstance(p, str) and p]
+
+
+def _compile_triggers() -> None:
+    """Precompute trigger needles from TRIGGER_PHRASE and TRIGGER_PHRASES.
+
+    Both the original and case-folded forms are kept so that
+    TRIGGER_CASE_SENSITIVE is still honoured at match time.
+    """
+    global _TRIGGERS
+    # Interned so recompiles reuse one canonical copy of each needle
+    phrases = tuple(
+        dict.fromkeys(sys.intern(p) for p in [TRIGGER_PHRASE, *_extra_trigger_phrases()])
+    )
+    folded = tuple(sys.intern(p.casefold()) for p in phrases)
+    _TRIGGERS = _TriggerSet(phrases, folded, min(len(n) for n in phrases + folded))
+    _find_trigger.cache_clear()
+
+
 def check_trigger(topic_text: str) -> bool:
-    """Check if topic contains trigger phrase.
+    """Check if topic contains any trigger phrase.
 
     Case sensitivity controlled by TRIGGER_CASE_SENSITIVE in config.py.
     Defaults to case-sensitive matching to avoid false positives.
     """
-    if TRIGGER_CASE_SENSITIVE:
-        return TRIGGER_PHRASE in topic_text
-    return TRIGGER_PHRASE.lower() in topic_text.lower()
+    return _find_trigger(topic_text, TRIGGER_CASE_SENSITIVE, _TRIGGERS) is not None
+
+
+def find_trigger(topic_text: str) -> tuple[str, int] | None:
+    """Return (phrase, offset) of the first matching trigger phrase, or None.
+
+    Phrases are tried in config order. In case-insensitive mode the offset
+    is into the case-folded topic.
+    """
+    return _find_trigger(topic_text, TRIGGER_CASE_SENSITIVE, _TRIGGERS)
+
+
+# The same topic is often seen repeatedly (RPL_TOPIC on every rejoin),
+# so remember recent results. Keyed on everything that affects the
+# result, so cached entries can't go stale when the config changes.
+@functools.lru_cache(maxsize=256)
+def _find_trigger(
+    topic_text: str, case_sensitive: bool, triggers: _TriggerSet
+) -> tuple[str, int] | None:
+    # Too short to hold any phrase. Only safe for ASCII when folding,
+    # since casefold() can lengthen non-ASCII text (ß -> ss).
+    if len(topic_text) < triggers.min_len and (case_sensitive or topic_text.isascii()):
+        return None
+    if case_sensitive:
+        needles, haystack = triggers.phrases, topic_text
+    else:
+        # Normalize the topic once, however many phrases are configured
+        needles, haystack = triggers.folded, topic_text.casefold()
+    for phrase, needle in zip(triggers.phrases, needles):
+        # One scan gives both the answer and the position to log
+        offset = haystack.find(needle)
+        if offset >= 0:
+            return phrase, offset
+    return None
+
+
+_compile_triggers()
 
 
 # =============================================================================
 # Health Check Server
 # =============================================================================
 
-class HealthHandler(BaseHTTPRequestHandler):
-    """Simple HTTP handler for health checks."""
+# Precomputed health responses (status line, headers and body)
+_HEALTH_OK = b"HTTP/1.0 200 OK\r\nContent-Length: 2\r\nConnection: close\r\n\r\nOK"
+_HEALTH_NOT_READY = (
+    b"HTTP/1.0 503 Service Unavailable\r\nContent-Length: 13\r\nConnection: close\r\n\r\n"
+    b"Not connected"
+)
+_HEALTH_NOT_FOUND = b"HTTP/1.0 404 Not Found\r\nContent-Length: 0\r\nConnection: close\r\n\r\n"
 
-    def do_GET(self):
-        if self.path == "/health" or self.path == "/":
-            if _bot_status["channel_joined"]:
-                self.send_response(200)
-                self.end_headers()
-                self.wfile.write(b"OK")
-            else:
-                self.send_response(503)
-                self.end_headers()
-                self.wfile.write(b"Not connected")
-        else:
-            self.send_response(404)
-            self.end_headers()
+# Seconds a probe connection may take to send its request. Probes are
+# served one at a time, so this stays well under the Dockerfile's 5s
+# HEALTHCHECK timeout: a client that connects and stalls can't fail the
+# real probe queued behind it.
+HEALTH_CLIENT_TIMEOUT = 1.0
 
-    def log_message(self, format, *args):
-        pass  # Suppress request logging
+# Pause after a failed accept() (e.g. EMFILE) so the loop doesn't spin
+HEALTH_ACCEPT_RETRY_SECONDS = 0.1
 
 
-def start_health_server(port: int) -> HTTPServer:
+def _health_response(request: bytes) -> bytes:
+    """Pick the health response for a raw HTTP request.
+
+    Only the request line is inspected; probes don't need a full parser.
+    """
+    parts = request.split(b" ", 2)
+    path = parts[1] if len(parts) > 1 else b""
+    if path == b"/health" or path == b"/":
+        return _HEALTH_OK if _channel_joined_event.is_set() else _HEALTH_NOT_READY
+    return _HEALTH_NOT_FOUND
+
+
+def _serve_health(sock: socket.socket) -> None:
+    """Accept probes until the socket is closed, answering each with one precomputed write."""
+    while True:
+        try:
+            conn, _ = sock.accept()
+        except OSError as e:
+            if sock.fileno() == -1:
+                return  # Listening socket was closed
+            # Transient (EMFILE, ENOBUFS, ECONNABORTED...): keep serving
+            logger.warning(f"Health server accept failed: {e}")
+            time.sleep(HEALTH_ACCEPT_RETRY_SECONDS)
+            continue
+        with conn:
+            try:
+                conn.settimeout(HEALTH_CLIENT_TIMEOUT)
+                conn.sendall(_health_response(conn.recv(1024)))
+            except OSError:
+                pass  # Probe went away or stalled; nothing to report
+
+
+def start_health_server(port: int) -> socket.socket:
     """Start health check server in background thread."""
-    server = HTTPServer(("0.0.0.0", port), HealthHandler)
-    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    sock = socket.create_server(("0.0.0.0", port))
+    thread = threading.Thread(target=_serve_health, args=(sock,), daemon=True)
     thread.start()
     logger.info(f"Health server listening on port {port}")
-    return server
+    return sock
 
 
 # =============================================================================
@@ -192,15 +512,16 @@ class TopicMonitor(SingleServerIRCBot):
     """
 
     channel: str
-    last_notification: datetime | None
+    last_notification_mono: float | None
     current_topic: str | None
+    _last_triggered_topic: str | None
+    reconnect_backoff: float
+    _topic_generation: int
     _shutdown: bool
 
     def __init__(self) -> None:
-        # Modern SSL context with proper hostname verification
-        ssl_context = ssl.create_default_context()
         ssl_factory = Factory(
-            wrapper=lambda sock: ssl_context.wrap_socket(sock, server_hostname=IRC_SERVER)
+            wrapper=lambda sock: _SSL_CONTEXT.wrap_socket(sock, server_hostname=IRC_SERVER)
         )
 
         super().__init__(
@@ -211,14 +532,18 @@ class TopicMonitor(SingleServerIRCBot):
         )
 
         self.channel = IRC_CHANNEL
-        self.last_notification = None
+        self.last_notification_mono = None
         self.current_topic = None
+        self._last_triggered_topic = None
+        self.reconnect_backoff = RECONNECT_BACKOFF_MIN
+        self._topic_generation = 0
         self._shutdown = False
         logger.info(f"Bot initialized for {IRC_SERVER}:{IRC_PORT} {IRC_CHANNEL}")
     
     def on_welcome(self, connection, event):
         """Connected to server."""
-        _bot_status["connected"] = True
+        _connected_event.set()
+        self.reconnect_backoff = RECONNECT_BACKOFF_MIN
         logger.info(f"Connected to {IRC_SERVER}. Joining {self.channel}...")
         connection.join(self.channel)
     
@@ -231,57 +556,135 @@ class TopicMonitor(SingleServerIRCBot):
     def on_join(self, connection, event):
         """Joined channel."""
         if event.source.nick == connection.get_nickname():
-            _bot_status["channel_joined"] = True
+            _channel_joined_event.set()
             logger.info(f"Successfully joined {self.channel}")
     
     def on_currenttopic(self, connection, event):
         """Current topic on join (RPL_TOPIC 332)."""
         topic = event.arguments[1] if len(event.arguments) > 1 else ""
-        logger.info(f"Current topic ({len(topic)} chars): {topic[:100]}{'...' if len(topic) > 100 else ''}")
-        logger.debug(f"Full topic: {topic}")
-        self.current_topic = topic
-        self._check_topic(topic, is_change=False)
+        self._ingest_topic(topic, is_change=False)
     
     def on_topic(self, connection, event):
         """Topic changed."""
         new_topic = event.arguments[0] if event.arguments else ""
         changer = event.source.nick if event.source else "Unknown"
-        
-        logger.info(f"Topic changed by {changer} ({len(new_topic)} chars): {new_topic[:100]}{'...' if len(new_topic) > 100 else ''}")
-        logger.debug(f"Full new topic: {new_topic}")
-        
-        if new_topic != self.current_topic:
-            self.current_topic = new_topic
-            self._check_topic(new_topic, is_change=True)
+        self._ingest_topic(new_topic, is_change=True, changer=changer)
+
+    def _ingest_topic(self, topic: str, is_change: bool, changer: str | None = None) -> None:
+        """Shared handling for the topic on join and for topic changes.
+
+        The topic on join is checked immediately; changes are debounced
+        and ignored if identical to the topic we already have.
+        """
+        # %-style args so nothing is sliced or formatted at quieter log levels
+        ellipsis = "..." if len(topic) > 100 else ""
+        if is_change:
+            logger.info("Topic changed by %s (%d chars): %.100s%s", changer, len(topic), topic, ellipsis)
+        else:
+            logger.info("Current topic (%d chars): %.100s%s", len(topic), topic, ellipsis)
+        logger.debug("Full topic: %s", topic)
+
+        if not is_change:
+            self.current_topic = topic
+            self._topic_generation += 1  # Supersedes any pending debounced check
+            self._check_topic(topic, is_change=False)
+        elif topic != self.current_topic:
+            self.current_topic = topic
+            self._schedule_topic_check()
+
+    def _schedule_topic_check(self) -> None:
+        """Check the current topic once edits have settled (trailing edge).
+
+        Each change bumps a generation counter; only the callback scheduled
+        for the latest change does any work.
+        """
+        self._topic_generation += 1
+        generation = self._topic_generation
+        self.reactor.scheduler.execute_after(
+            TOPIC_DEBOUNCE_SECONDS, lambda: self._flush_topic_check(generation)
+        )
+
+    def _flush_topic_check(self, generation: int) -> None:
+        """Run the debounced topic check if no newer change superseded it."""
+        if generation == self._topic_generation and self.current_topic is not None:
+            self._check_topic(self.current_topic, is_change=True)
     
     def _check_topic(self, topic: str, is_change: bool = False) -> None:
         """Check if topic contains trigger phrase."""
-        if check_trigger(topic):
-            logger.warning(f"🎉 TRIGGER DETECTED: '{TRIGGER_PHRASE}'")
+        should_notify = self._should_notify()
+
+        # Same topic we already notified for and still cooling down:
+        # the scan can't change the outcome, so skip it
+        if not should_notify and topic == self._last_triggered_topic:
+            logger.debug("Topic unchanged since last notification (cooldown active)")
+            return
+
+        match = find_trigger(topic)
+        if match:
+            phrase, offset = match
+            logger.warning(f"🎉 TRIGGER DETECTED: '{phrase}' at offset {offset}")
             
-            if self._should_notify():
-                if send_pushover_notification():
-                    self.last_notification = datetime.now()
+            if should_notify:
+                self._queue_notification(topic)
             else:
-                cooldown_remaining = (
-                    self.last_notification + timedelta(minutes=NOTIFICATION_COOLDOWN_MINUTES) 
-                    - datetime.now()
-                )
-                logger.info(f"Notification skipped (cooldown: {cooldown_remaining.seconds}s remaining)")
+                logger.info(f"Notification skipped (cooldown: {self._cooldown_remaining():.0f}s remaining)")
         else:
             logger.debug("Trigger phrase not found in topic")
     
+    def _queue_notification(self, topic: str) -> None:
+        """Hand a notification to the sender thread without blocking."""
+        try:
+            _notify_queue.put_nowait(lambda: self._deliver_notification(topic))
+        except queue.Full:
+            logger.warning("Notification queue full, dropping notification")
+
+    def _deliver_notification(self, topic: str) -> None:
+        """Send a queued notification. Runs on the notification worker."""
+        # An earlier queued job may have started the cooldown meanwhile
+        if not self._should_notify():
+            return
+        try:
+            sent = _send_pushover(None, None, False)
+        except _RateLimited as e:
+            self._retry_notification(topic, e.retry_after)
+            return
+        if sent:
+            self.last_notification_mono = time.monotonic()
+            self._last_triggered_topic = topic
+
+    def _retry_notification(self, topic: str, delay: float) -> None:
+        """Re-queue a rate-limited notification once sending resumes.
+
+        An unchanged topic won't trigger again on its own, so dropping the
+        job would lose the alert. A timer rather than the reactor scheduler,
+        since this runs on the notification worker, not the IRC thread.
+        """
+        logger.info(f"Retrying notification in {delay:.0f}s")
+        timer = threading.Timer(delay, lambda: self._queue_notification(topic))
+        timer.daemon = True
+        timer.start()
+
+    def _cooldown_remaining(self) -> float:
+        """Seconds left before another notification may be sent."""
+        if self.last_notification_mono is None:
+            return 0.0
+        elapsed = time.monotonic() - self.last_notification_mono
+        return max(NOTIFICATION_COOLDOWN_MINUTES * 60 - elapsed, 0.0)
+
     def _should_notify(self) -> bool:
-        """Check if cooldown has elapsed."""
-        if self.last_notification is None:
+        """Check if cooldown has elapsed.
+
+        Uses time.monotonic() so wall-clock jumps can't shorten or
+        extend the cooldown.
+        """
+        if self.last_notification_mono is None:
             return True
-        cooldown = timedelta(minutes=NOTIFICATION_COOLDOWN_MINUTES)
-        return datetime.now() - self.last_notification > cooldown
+        return time.monotonic() - self.last_notification_mono > NOTIFICATION_COOLDOWN_MINUTES * 60
     
     def on_disconnect(self, connection, event):
         """Disconnected from server."""
-        _bot_status["connected"] = False
-        _bot_status["channel_joined"] = False
+        _connected_event.clear()
+        _channel_joined_event.clear()
         if self._shutdown:
             logger.info("Disconnected (shutdown requested)")
         else:
@@ -291,11 +694,27 @@ class TopicMonitor(SingleServerIRCBot):
         """Kicked from channel."""
         kicked_nick = event.arguments[0] if event.arguments else ""
         if kicked_nick == connection.get_nickname():
-            _bot_status["channel_joined"] = False
+            _channel_joined_event.clear()
             logger.warning(f"Kicked from {self.channel}. Rejoining in 30s...")
-            time.sleep(30)
+            # Schedule on the reactor rather than sleeping, so PING/PONG
+            # keeps being handled while we wait
+            self.reactor.scheduler.execute_after(30, lambda: self._rejoin(connection))
+
+    def _rejoin(self, connection) -> None:
+        """Rejoin the channel after a kick, if still connected."""
+        if connection.is_connected():
             connection.join(self.channel)
     
+    def next_reconnect_delay(self) -> float:
+        """Return a jittered restart delay and grow the backoff.
+
+        Uses exponential backoff with full jitter so that many instances
+        don't reconnect in lockstep. Reset on successful connect.
+        """
+        delay = random.uniform(0, self.reconnect_backoff)
+        self.reconnect_backoff = min(self.reconnect_backoff * 2, RECONNECT_BACKOFF_MAX)
+        return delay
+
     def on_error(self, connection, event):
         """IRC protocol error."""
         logger.error(f"IRC error: {event.arguments}")
@@ -335,8 +754,10 @@ def main() -> None:
     # Test trigger detection
     if args.test_trigger:
         logger.info(f"Testing trigger detection against: {args.test_trigger}")
-        if check_trigger(args.test_trigger):
-            logger.info(f"✅ WOULD TRIGGER - phrase '{TRIGGER_PHRASE}' found")
+        match = find_trigger(args.test_trigger)
+        if match:
+            phrase, offset = match
+            logger.info(f"✅ WOULD TRIGGER - phrase '{phrase}' found at offset {offset}")
         else:
             logger.info(f"❌ Would NOT trigger - phrase '{TRIGGER_PHRASE}' not found")
         sys.exit(0)
@@ -347,11 +768,14 @@ def main() -> None:
     logger.info(f"Server: {IRC_SERVER}:{IRC_PORT}")
     logger.info(f"Channel: {IRC_CHANNEL}")
     logger.info(f"Trigger: '{TRIGGER_PHRASE}'")
+    if TRIGGER_PHRASES:
+        logger.info(f"Additional triggers: {TRIGGER_PHRASES}")
     logger.info(f"Cooldown: {NOTIFICATION_COOLDOWN_MINUTES} minutes")
     logger.info("=" * 50)
 
     # Start health check server
     health_server = start_health_server(HEALTH_PORT)
+    start_notification_worker()
     
     bot = TopicMonitor()
     
@@ -376,8 +800,9 @@ def main() -> None:
             if bot._shutdown:
                 break
             logger.error(f"Bot error: {e}")
-            logger.info("Restarting in 60s...")
-            time.sleep(60)
+            delay = bot.next_reconnect_delay()
+            logger.info(f"Restarting in {delay:.1f}s...")
+            time.sleep(delay)
     
     logger.info("Goodbye!")
 
@@ -2,106 +2,209 @@
 
 from __future__ import annotations
 
+import os
+import queue
+import subprocess
 import sys
+import threading
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
+from urllib.parse import parse_qsl
 
 import pytest
 
 # Add parent directory to path so we can import the module
-sys.path.insert(0, str(Path(__file__).parent.parent))
+REPO_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+MOCK_CONFIG_VALUES: dict[str, Any] = {
+    "IRC_SERVER": "irc.example.com",
+    "IRC_PORT": 6697,
+    "IRC_CHANNEL": "#test-channel",
+    "IRC_NICKNAME": "TestBot",
+    "IRC_REALNAME": "Test Bot",
+    "TRIGGER_PHRASE": "ONLINE",
+    "TRIGGER_CASE_SENSITIVE": True,
+    "TRIGGER_PHRASES": [],
+    "PUSHOVER_APP_TOKEN": "abc123token",
+    "PUSHOVER_USER_KEY": "xyz789user",
+    "NOTIFICATION_TITLE": "Test Alert",
+    "NOTIFICATION_MESSAGE": "Test message",
+    "NOTIFICATION_URL": "https://example.com",
+    "NOTIFICATION_URL_TITLE": "Click here",
+    "NOTIFICATION_COOLDOWN_MINUTES": 30,
+    "LOG_LEVEL": "INFO",
+}
+
+
+def _install_mock_config(values: dict[str, Any]) -> None:
+    """Put a mock config module in sys.modules for irc_topic_notify to import."""
+    mock_config = MagicMock()
+    for key, value in values.items():
+        setattr(mock_config, key, value)
+    sys.modules["config"] = mock_config
+
+
+# Mock irc and config at conftest import, so irc_topic_notify can be
+# imported once (at module level in tests) and shared by every test
+_mock_irc = MagicMock()
+_mock_irc.bot.SingleServerIRCBot = MagicMock
+_mock_irc.connection.Factory = MagicMock
+sys.modules["irc"] = _mock_irc
+sys.modules["irc.bot"] = _mock_irc.bot
+sys.modules["irc.connection"] = _mock_irc.connection
+_install_mock_config(MOCK_CONFIG_VALUES)
 
 
-# Mock the irc module before any test imports irc_topic_notify
 @pytest.fixture(scope="session", autouse=True)
 def mock_irc_module():
     """Mock the irc module globally for all tests."""
-    mock_irc = MagicMock()
-    mock_irc.bot.SingleServerIRCBot = MagicMock
-    mock_irc.connection.Factory = MagicMock
-    sys.modules["irc"] = mock_irc
-    sys.modules["irc.bot"] = mock_irc.bot
-    sys.modules["irc.connection"] = mock_irc.connection
-    yield mock_irc
+    yield _mock_irc
 
 
 @pytest.fixture
 def mock_config_values() -> dict[str, Any]:
     """Return a valid mock configuration dictionary."""
+    return dict(MOCK_CONFIG_VALUES)
+
+
+def _fresh_runtime_state(module) -> dict[str, Any]:
+    """Return new instances of the module's mutable runtime state."""
     return {
-        "IRC_SERVER": "irc.example.com",
-        "IRC_PORT": 6697,
-        "IRC_CHANNEL": "#test-channel",
-        "IRC_NICKNAME": "TestBot",
-        "IRC_REALNAME": "Test Bot",
-        "TRIGGER_PHRASE": "ONLINE",
-        "TRIGGER_CASE_SENSITIVE": True,
-        "PUSHOVER_APP_TOKEN": "abc123token",
-        "PUSHOVER_USER_KEY": "xyz789user",
-        "NOTIFICATION_TITLE": "Test Alert",
-        "NOTIFICATION_MESSAGE": "Test message",
-        "NOTIFICATION_URL": "https://example.com",
-        "NOTIFICATION_URL_TITLE": "Click here",
-        "NOTIFICATION_COOLDOWN_MINUTES": 30,
-        "LOG_LEVEL": "INFO",
+        "_pushover_bucket": module._TokenBucket(
+            module.PUSHOVER_RATE_LIMIT_BURST, module.PUSHOVER_RATE_LIMIT_PER_MINUTE / 60
+        ),
+        "_notify_queue": queue.Queue(maxsize=module.NOTIFY_QUEUE_SIZE),
+        "_connected_event": threading.Event(),
+        "_channel_joined_event": threading.Event(),
     }
 
 
 @pytest.fixture
 def patch_config(mock_config_values: dict[str, Any], mock_irc_module):
-    """Patch the config module with mock values before importing irc_topic_notify."""
-    # Create a mock config module
-    mock_config = MagicMock()
-    for key, value in mock_config_values.items():
-        setattr(mock_config, key, value)
-
-    # Add config to sys.modules before importing irc_topic_notify
-    sys.modules["config"] = mock_config
-
-    # Now we need to reload irc_topic_notify to pick up the mocked config
-    # First remove it if it was already imported
-    if "irc_topic_notify" in sys.modules:
-        del sys.modules["irc_topic_notify"]
+    """Apply mock config and fresh runtime state to irc_topic_notify.
 
-    # Import fresh with mocked dependencies
+    Attributes are snapshotted and restored with setattr rather than
+    reloading the module, which would re-run its whole import.
+    """
     import irc_topic_notify
 
-    # Patch the module-level variables
-    for key, value in mock_config_values.items():
-        if hasattr(irc_topic_notify, key):
-            setattr(irc_topic_notify, key, value)
+    overrides = {**mock_config_values, **_fresh_runtime_state(irc_topic_notify)}
+    snapshot = {key: getattr(irc_topic_notify, key) for key in overrides}
+    for key, value in overrides.items():
+        setattr(irc_topic_notify, key, value)
+    # Refresh state derived from the config values
+    irc_topic_notify._compile_triggers()
+    irc_topic_notify._build_pushover_payload()
 
     yield mock_config_values
 
-    # Cleanup
-    if "config" in sys.modules:
-        del sys.modules["config"]
-    if "irc_topic_notify" in sys.modules:
-        del sys.modules["irc_topic_notify"]
+    for key, value in snapshot.items():
+        setattr(irc_topic_notify, key, value)
+    irc_topic_notify._compile_triggers()
+    irc_topic_notify._build_pushover_payload()
+
+
+@dataclass
+class PostCall:
+    """One recorded Pushover POST, with the form body decoded."""
+
+    url: str
+    data: dict[str, str]
+    timeout: Any = None
+
+
+class _FakePost:
+    """Stand-in for Session.send that records Pushover POSTs as PostCall entries.
+
+    The instance doubles as the response, so status_code, text and
+    headers are read straight off it.
+    """
+
+    def __init__(
+        self,
+        status_code: int = 200,
+        text: str = '{"status":1}',
+        headers: dict[str, str] | None = None,
+        exc: Exception | None = None,
+    ) -> None:
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers or {}
+        self.exc = exc
+        self.calls: list[PostCall] = []
+
+    def __call__(self, prepared: Any, **kwargs: Any) -> _FakePost:
+        self.calls.append(
+            PostCall(
+                url=prepared.url,
+                data=dict(parse_qsl(prepared.body)),
+                timeout=kwargs.get("timeout"),
+            )
+        )
+        if self.exc is not None:
+            raise self.exc
+        return self
 
 
 @pytest.fixture
-def mock_requests_post(patch_config):
-    """Mock requests.post for Pushover API calls."""
+def fake_post(patch_config, monkeypatch):
+    """Return a function that installs a _FakePost as the shared session's send()."""
     import irc_topic_notify
 
-    with patch.object(irc_topic_notify.requests, "post") as mock_post:
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.text = '{"status":1}'
-        mock_post.return_value = mock_response
-        yield mock_post
+    def install(**kwargs: Any) -> _FakePost:
+        fake = _FakePost(**kwargs)
+        monkeypatch.setattr(irc_topic_notify._SESSION, "send", fake)
+        return fake
+
+    return install
+
+
+@pytest.fixture
+def mock_requests_post(fake_post) -> _FakePost:
+    """Fake the shared session's send() for Pushover API calls."""
+    return fake_post()
 
 
 @pytest.fixture
-def mock_requests_post_failure(patch_config):
-    """Mock requests.post to simulate Pushover API failure."""
+def mock_requests_post_failure(fake_post) -> _FakePost:
+    """Fake the shared session's send() to simulate Pushover API failure."""
+    return fake_post(status_code=400, text='{"errors":["invalid token"]}')
+
+
+@pytest.fixture
+def drain_notifications(patch_config):
+    """Return a function that runs queued notification jobs synchronously."""
     import irc_topic_notify
 
-    with patch.object(irc_topic_notify.requests, "post") as mock_post:
-        mock_response = MagicMock()
-        mock_response.status_code = 400
-        mock_response.text = '{"errors":["invalid token"]}'
-        mock_post.return_value = mock_response
-        yield mock_post
+    def drain() -> None:
+        while not irc_topic_notify._notify_queue.empty():
+            job = irc_topic_notify._notify_queue.get_nowait()
+            job()
+            irc_topic_notify._notify_queue.task_done()
+
+    return drain
+
+
+@pytest.fixture
+def run_with_config(tmp_path):
+    """Return a function that runs Python code in a fresh interpreter.
+
+    The module is imported for real (no mocks) against a config.py written
+    from MOCK_CONFIG_VALUES plus any overrides. Returns the CompletedProcess.
+    """
+
+    def run(code: str, **overrides: Any) -> subprocess.CompletedProcess:
+        values = {**MOCK_CONFIG_VALUES, **overrides}
+        (tmp_path / "config.py").write_text(
+            "".join(f"{key} = {value!r}\n" for key, value in values.items())
+        )
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join([str(tmp_path), str(REPO_ROOT)])}
+        return subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=tmp_path, env=env, capture_output=True, text=True, timeout=30,
+        )
+
+    return run
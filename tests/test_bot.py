@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+import logging
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -25,7 +26,7 @@ class TestTopicMonitorInit:
 
         bot = irc_topic_notify.TopicMonitor()
 
-        assert bot.last_notification is None
+        assert bot.last_notification_mono is None
 
     def test_bot_starts_with_no_current_topic(self, patch_config):
         """Bot starts with no current topic."""
@@ -52,7 +53,7 @@ class TestShouldNotify:
         import irc_topic_notify
 
         bot = irc_topic_notify.TopicMonitor()
-        bot.last_notification = None
+        bot.last_notification_mono = None
 
         assert bot._should_notify() is True
 
@@ -62,7 +63,7 @@ class TestShouldNotify:
 
         bot = irc_topic_notify.TopicMonitor()
         # Set last notification to 31 minutes ago (cooldown is 30)
-        bot.last_notification = datetime.now() - timedelta(minutes=31)
+        bot.last_notification_mono = time.monotonic() - 31 * 60
 
         assert bot._should_notify() is True
 
@@ -72,7 +73,7 @@ class TestShouldNotify:
 
         bot = irc_topic_notify.TopicMonitor()
         # Set last notification to 10 minutes ago (cooldown is 30)
-        bot.last_notification = datetime.now() - timedelta(minutes=10)
+        bot.last_notification_mono = time.monotonic() - 10 * 60
 
         assert bot._should_notify() is False
 
@@ -82,7 +83,7 @@ class TestShouldNotify:
 
         bot = irc_topic_notify.TopicMonitor()
         # Set last notification to just over 30 minutes ago
-        bot.last_notification = datetime.now() - timedelta(minutes=30, seconds=1)
+        bot.last_notification_mono = time.monotonic() - (30 * 60 + 1)
 
         assert bot._should_notify() is True
 
@@ -90,64 +91,425 @@ class TestShouldNotify:
 class TestCheckTopic:
     """Tests for the _check_topic method."""
 
-    def test_check_topic_triggers_notification(self, mock_requests_post):
+    def test_check_topic_triggers_notification(self, mock_requests_post, drain_notifications):
         """Trigger phrase in topic causes notification."""
         import irc_topic_notify
 
         bot = irc_topic_notify.TopicMonitor()
-        bot.last_notification = None
+        bot.last_notification_mono = None
 
         bot._check_topic("Server: ONLINE")
+        drain_notifications()
 
-        mock_requests_post.assert_called_once()
-        assert bot.last_notification is not None
+        assert len(mock_requests_post.calls) == 1
+        assert bot.last_notification_mono is not None
 
-    def test_check_topic_no_trigger_no_notification(self, mock_requests_post):
+    def test_check_topic_no_trigger_no_notification(self, mock_requests_post, drain_notifications):
         """No trigger phrase means no notification."""
         import irc_topic_notify
 
         bot = irc_topic_notify.TopicMonitor()
         bot._check_topic("Server: OFFLINE")
+        drain_notifications()
 
-        mock_requests_post.assert_not_called()
+        assert mock_requests_post.calls == []
 
-    def test_check_topic_respects_cooldown(self, mock_requests_post):
+    def test_check_topic_respects_cooldown(self, mock_requests_post, drain_notifications):
         """Notification respects cooldown period."""
         import irc_topic_notify
 
         bot = irc_topic_notify.TopicMonitor()
-        bot.last_notification = datetime.now() - timedelta(minutes=5)
+        bot.last_notification_mono = time.monotonic() - 5 * 60
 
         bot._check_topic("Server: ONLINE")
+        drain_notifications()
 
-        mock_requests_post.assert_not_called()
+        assert mock_requests_post.calls == []
 
-    def test_check_topic_updates_last_notification_on_success(self, mock_requests_post):
-        """Successful notification updates last_notification timestamp."""
+    def test_check_topic_updates_last_notification_on_success(self, mock_requests_post, drain_notifications):
+        """Successful notification updates the last notification timestamp."""
         import irc_topic_notify
 
         bot = irc_topic_notify.TopicMonitor()
-        bot.last_notification = None
-        before = datetime.now()
+        bot.last_notification_mono = None
+        before = time.monotonic()
 
         bot._check_topic("Server: ONLINE")
+        drain_notifications()
 
-        assert bot.last_notification is not None
-        assert bot.last_notification >= before
+        assert bot.last_notification_mono is not None
+        assert bot.last_notification_mono >= before
 
-    def test_check_topic_does_not_update_on_failure(self, patch_config):
-        """Failed notification doesn't update last_notification."""
+    def test_check_topic_skips_scan_for_same_topic_in_cooldown(self, mock_requests_post, drain_notifications):
+        """Re-checking the already-notified topic during cooldown skips the scan."""
         import irc_topic_notify
 
-        with patch.object(irc_topic_notify.requests, "post") as mock_post:
-            mock_post.return_value = MagicMock(status_code=500, text="error")
+        bot = irc_topic_notify.TopicMonitor()
+        bot._check_topic("Server: ONLINE")
+        drain_notifications()
+        assert bot._last_triggered_topic == "Server: ONLINE"
+
+        with patch.object(irc_topic_notify, "find_trigger") as mock_check:
+            bot._check_topic("Server: ONLINE")
+        drain_notifications()
+
+        mock_check.assert_not_called()
+        assert len(mock_requests_post.calls) == 1
+
+    def test_check_topic_scans_new_topic_in_cooldown(self, mock_requests_post, drain_notifications):
+        """A different topic is still scanned during cooldown."""
+        import irc_topic_notify
+
+        bot = irc_topic_notify.TopicMonitor()
+        bot._check_topic("Server: ONLINE")
+        drain_notifications()
+
+        with patch.object(irc_topic_notify, "find_trigger", return_value=None) as mock_check:
+            bot._check_topic("Server: ONLINE again")
+
+        mock_check.assert_called_once_with("Server: ONLINE again")
+
+    def test_check_topic_does_not_update_on_failure(self, fake_post, drain_notifications):
+        """Failed notification doesn't update the last notification timestamp."""
+        import irc_topic_notify
+
+        fake_post(status_code=500, text="error")
+        bot = irc_topic_notify.TopicMonitor()
+        bot.last_notification_mono = None
+
+        bot._check_topic("Server: ONLINE")
+        drain_notifications()
+
+        assert bot.last_notification_mono is None
+
+    def test_check_topic_does_not_block_on_send(self, mock_requests_post):
+        """Triggered notification is queued, not sent on the IRC thread."""
+        import irc_topic_notify
+
+        bot = irc_topic_notify.TopicMonitor()
+        bot._check_topic("Server: ONLINE")
+
+        assert mock_requests_post.calls == []
+        assert irc_topic_notify._notify_queue.qsize() == 1
+
+    def test_queued_duplicates_sent_once(self, mock_requests_post, drain_notifications):
+        """Triggers queued before the first send completes notify only once."""
+        import irc_topic_notify
+
+        bot = irc_topic_notify.TopicMonitor()
+        bot._check_topic("Server: ONLINE")
+        bot._check_topic("Server: ONLINE!")
+        drain_notifications()
+
+        assert len(mock_requests_post.calls) == 1
+
+    def test_zero_cooldown_notifies_each_trigger(self, mock_requests_post, drain_notifications):
+        """With no cooldown, consecutive triggering topics each notify."""
+        import irc_topic_notify
+
+        irc_topic_notify.NOTIFICATION_COOLDOWN_MINUTES = 0
+        bot = irc_topic_notify.TopicMonitor()
+
+        bot._check_topic("Server: ONLINE")
+        drain_notifications()
+        bot._check_topic("Server: ONLINE again")
+        drain_notifications()
+
+        assert len(mock_requests_post.calls) == 2
+        assert bot._last_triggered_topic == "Server: ONLINE again"
+
+    def test_429_notification_is_retried(self, fake_post, drain_notifications):
+        """An alert refused with a 429 is sent once the Retry-After passes."""
+        import irc_topic_notify
+
+        fake = fake_post(status_code=429, text="", headers={"Retry-After": "120"})
+        bot = irc_topic_notify.TopicMonitor()
+
+        with patch.object(irc_topic_notify.threading, "Timer") as timer:
+            bot._check_topic("Server: ONLINE")
+            drain_notifications()
+        delay, retry = timer.call_args[0]
+        assert delay == 120.0
+        timer.return_value.start.assert_called_once()
+        assert bot.last_notification_mono is None
+
+        # Retry-After elapsed and Pushover accepts the retry
+        fake.status_code = 200
+        irc_topic_notify._pushover_bucket.paused_until = 0.0
+        retry()
+        drain_notifications()
+
+        assert len(fake.calls) == 2
+        assert bot.last_notification_mono is not None
+        assert bot._last_triggered_topic == "Server: ONLINE"
+
+    def test_locally_rate_limited_notification_is_retried(self, mock_requests_post, drain_notifications):
+        """An alert refused by the local token bucket is retried after a refill."""
+        import irc_topic_notify
+
+        irc_topic_notify._pushover_bucket.tokens = 0.0
+        bot = irc_topic_notify.TopicMonitor()
+
+        with patch.object(irc_topic_notify.threading, "Timer") as timer:
+            bot._check_topic("Server: ONLINE")
+            drain_notifications()
+        delay, retry = timer.call_args[0]
+        assert delay > 0
+        assert mock_requests_post.calls == []
 
-            bot = irc_topic_notify.TopicMonitor()
-            bot.last_notification = None
+        irc_topic_notify._pushover_bucket.tokens = 1.0
+        retry()
+        drain_notifications()
 
+        assert len(mock_requests_post.calls) == 1
+        assert bot.last_notification_mono is not None
+
+    def test_failed_notification_is_not_retried(self, fake_post, drain_notifications):
+        """A non-rate-limit failure is not retried."""
+        import irc_topic_notify
+
+        fake_post(status_code=400, text="bad request")
+        bot = irc_topic_notify.TopicMonitor()
+
+        with patch.object(irc_topic_notify.threading, "Timer") as timer:
             bot._check_topic("Server: ONLINE")
+            drain_notifications()
+
+        timer.assert_not_called()
+
+    def test_full_queue_drops_notification(self, patch_config, caplog):
+        """A full queue drops the notification with a warning."""
+        import irc_topic_notify
+
+        bot = irc_topic_notify.TopicMonitor()
+        for _ in range(irc_topic_notify.NOTIFY_QUEUE_SIZE + 1):
+            bot._queue_notification("Server: ONLINE")
+
+        assert irc_topic_notify._notify_queue.full()
+        assert "Notification queue full" in caplog.text
+
+
+class TestTopicDebounce:
+    """Tests for debounced handling of topic changes."""
+
+    @staticmethod
+    def _topic_event(topic):
+        return MagicMock(arguments=[topic], source=MagicMock(nick="op"))
+
+    def test_burst_of_changes_checked_once(self, patch_config):
+        """Rapid topic edits result in a single check of the final topic."""
+        import irc_topic_notify
+
+        bot = irc_topic_notify.TopicMonitor()
+        bot.reactor = MagicMock()
+        bot._check_topic = MagicMock()
+
+        bot.on_topic(MagicMock(), self._topic_event("Server: ONLNE"))
+        bot.on_topic(MagicMock(), self._topic_event("Server: ONLINE"))
+        bot._check_topic.assert_not_called()
+
+        scheduled = bot.reactor.scheduler.execute_after.call_args_list
+        assert len(scheduled) == 2
+        for call in scheduled:
+            delay, callback = call[0]
+            assert delay == irc_topic_notify.TOPIC_DEBOUNCE_SECONDS
+            callback()
+
+        bot._check_topic.assert_called_once_with("Server: ONLINE", is_change=True)
+
+    def test_topic_on_join_checked_immediately(self, patch_config):
+        """RPL_TOPIC on join is checked at once and supersedes pending checks."""
+        import irc_topic_notify
+
+        bot = irc_topic_notify.TopicMonitor()
+        bot.reactor = MagicMock()
+        bot._check_topic = MagicMock()
+
+        bot.on_topic(MagicMock(), self._topic_event("Server: ONLINE"))
+        bot.on_currenttopic(MagicMock(), MagicMock(arguments=["#test-channel", "Server: ONLINE"]))
+        bot._check_topic.assert_called_once_with("Server: ONLINE", is_change=False)
+
+        _, pending = bot.reactor.scheduler.execute_after.call_args[0]
+        pending()
+        bot._check_topic.assert_called_once()
+
+    def test_unchanged_topic_not_rescheduled(self, patch_config):
+        """Re-sent identical topic doesn't schedule another check."""
+        import irc_topic_notify
+
+        bot = irc_topic_notify.TopicMonitor()
+        bot.reactor = MagicMock()
+        bot.current_topic = "Server: ONLINE"
+
+        bot.on_topic(MagicMock(), self._topic_event("Server: ONLINE"))
+
+        bot.reactor.scheduler.execute_after.assert_not_called()
+
+
+class TestTopicLogging:
+    """Tests for the topic log lines written by _ingest_topic."""
+
+    def test_long_topic_change_logged_truncated(self, patch_config, caplog):
+        """Long changed topics are truncated to 100 chars in the INFO log line."""
+        import irc_topic_notify
+
+        bot = irc_topic_notify.TopicMonitor()
+        bot.reactor = MagicMock()
+        event = MagicMock(arguments=["x" * 150], source=MagicMock(nick="op"))
+
+        with caplog.at_level(logging.INFO, logger="irc_topic_notify"):
+            bot.on_topic(MagicMock(), event)
+
+        assert f"Topic changed by op (150 chars): {'x' * 100}..." in caplog.text
+        assert "x" * 101 not in caplog.text
+
+    def test_long_current_topic_logged_truncated(self, patch_config, caplog):
+        """Long topics on join are truncated to 100 chars in the INFO log line."""
+        import irc_topic_notify
+
+        bot = irc_topic_notify.TopicMonitor()
+        event = MagicMock(arguments=["#test-channel", "x" * 150])
+
+        with caplog.at_level(logging.INFO, logger="irc_topic_notify"):
+            bot.on_currenttopic(MagicMock(), event)
+
+        assert f"Current topic (150 chars): {'x' * 100}..." in caplog.text
+        assert "x" * 101 not in caplog.text
+
+    def test_short_topic_logged_whole(self, patch_config, caplog):
+        """Topics within the limit are logged without an ellipsis."""
+        import irc_topic_notify
+
+        bot = irc_topic_notify.TopicMonitor()
+        event = MagicMock(arguments=["#test-channel", "Server: OFFLINE"])
+
+        with caplog.at_level(logging.INFO, logger="irc_topic_notify"):
+            bot.on_currenttopic(MagicMock(), event)
+
+        assert "Current topic (15 chars): Server: OFFLINE\n" in caplog.text
+
+    def test_full_topic_logged_at_debug(self, patch_config, caplog):
+        """The untruncated topic is available at DEBUG."""
+        import irc_topic_notify
+
+        bot = irc_topic_notify.TopicMonitor()
+        event = MagicMock(arguments=["#test-channel", "x" * 150])
+
+        with caplog.at_level(logging.DEBUG, logger="irc_topic_notify"):
+            bot.on_currenttopic(MagicMock(), event)
+
+        assert f"Full topic: {'x' * 150}" in caplog.text
+
+
+class TestReconnectBackoff:
+    """Tests for the reconnect backoff used by main()."""
+
+    def test_backoff_doubles_up_to_cap(self, patch_config):
+        """Backoff doubles after each failure and is capped."""
+        import irc_topic_notify
+
+        bot = irc_topic_notify.TopicMonitor()
+        assert bot.reconnect_backoff == irc_topic_notify.RECONNECT_BACKOFF_MIN
+
+        for _ in range(20):
+            bot.next_reconnect_delay()
+
+        assert bot.reconnect_backoff == irc_topic_notify.RECONNECT_BACKOFF_MAX
+
+    def test_delay_is_jittered_within_backoff(self, patch_config):
+        """Delay is drawn from [0, current backoff]."""
+        import irc_topic_notify
+
+        bot = irc_topic_notify.TopicMonitor()
+        bot.reconnect_backoff = 8.0
+
+        with patch.object(irc_topic_notify.random, "uniform", return_value=3.5) as mock_uniform:
+            delay = bot.next_reconnect_delay()
+
+        mock_uniform.assert_called_once_with(0, 8.0)
+        assert delay == 3.5
+        assert bot.reconnect_backoff == 16.0
+
+    def test_welcome_resets_backoff(self, patch_config):
+        """Successful connect resets the backoff."""
+        import irc_topic_notify
+
+        bot = irc_topic_notify.TopicMonitor()
+        bot.reconnect_backoff = 64.0
+
+        bot.on_welcome(MagicMock(), MagicMock())
+
+        assert bot.reconnect_backoff == irc_topic_notify.RECONNECT_BACKOFF_MIN
+
+
+class TestOnKick:
+    """Tests for the on_kick handler."""
+
+    def test_kick_schedules_rejoin_without_blocking(self, patch_config):
+        """Being kicked schedules a rejoin instead of sleeping."""
+        import irc_topic_notify
+
+        bot = irc_topic_notify.TopicMonitor()
+        bot.reactor = MagicMock()
+        connection = MagicMock()
+        connection.get_nickname.return_value = "TestBot"
+        event = MagicMock(arguments=["TestBot"])
+
+        with patch.object(irc_topic_notify.time, "sleep") as mock_sleep:
+            bot.on_kick(connection, event)
+
+        mock_sleep.assert_not_called()
+        connection.join.assert_not_called()
+        delay, rejoin = bot.reactor.scheduler.execute_after.call_args[0]
+        assert delay == 30
+
+        rejoin()
+        connection.join.assert_called_once_with("#test-channel")
+
+    def test_rejoin_skipped_when_disconnected(self, patch_config):
+        """Scheduled rejoin does nothing if the connection dropped meanwhile."""
+        import irc_topic_notify
+
+        bot = irc_topic_notify.TopicMonitor()
+        connection = MagicMock()
+        connection.is_connected.return_value = False
+
+        bot._rejoin(connection)
+
+        connection.join.assert_not_called()
+
+
+class TestConnectionStatus:
+    """Tests for the connection status read by the health server."""
+
+    def test_join_and_disconnect_update_status(self, patch_config):
+        """Joining sets the joined flag; disconnecting clears both flags."""
+        import irc_topic_notify
+
+        bot = irc_topic_notify.TopicMonitor()
+        connection = MagicMock()
+        connection.get_nickname.return_value = "TestBot"
+
+        bot.on_welcome(connection, MagicMock())
+        bot.on_join(connection, MagicMock(source=MagicMock(nick="TestBot")))
+        assert irc_topic_notify._connected_event.is_set()
+        assert irc_topic_notify._channel_joined_event.is_set()
+
+        bot.on_disconnect(connection, MagicMock())
+        assert not irc_topic_notify._connected_event.is_set()
+        assert not irc_topic_notify._channel_joined_event.is_set()
+
+    def test_other_user_join_ignored(self, patch_config):
+        """Another user joining doesn't mark the bot as joined."""
+        import irc_topic_notify
+
+        bot = irc_topic_notify.TopicMonitor()
+        connection = MagicMock()
+        connection.get_nickname.return_value = "TestBot"
+
+        bot.on_join(connection, MagicMock(source=MagicMock(nick="someone")))
 
-            assert bot.last_notification is None
+        assert not irc_topic_notify._channel_joined_event.is_set()
 
 
 class TestShutdown:
@@ -33,6 +33,15 @@ class TestValidateConfig:
             irc_topic_notify.validate_config()
         assert exc_info.value.code == 1
 
+    def test_placeholder_check_is_case_insensitive(self, patch_config):
+        """Placeholder detection ignores case."""
+        import irc_topic_notify
+
+        irc_topic_notify.PUSHOVER_USER_KEY = "YOUR-USER-KEY-HERE"
+        with pytest.raises(SystemExit) as exc_info:
+            irc_topic_notify.validate_config()
+        assert exc_info.value.code == 1
+
     def test_empty_pushover_app_token_exits(self, patch_config):
         """Empty Pushover app token causes exit."""
         import irc_topic_notify
@@ -68,6 +77,44 @@ class TestValidateConfig:
         # Should not raise
         irc_topic_notify.validate_config()
 
+    def test_trigger_phrases_string_exits(self, patch_config):
+        """TRIGGER_PHRASES given as a bare string causes exit."""
+        import irc_topic_notify
+
+        irc_topic_notify.TRIGGER_PHRASES = "BACK UP"
+        with pytest.raises(SystemExit) as exc_info:
+            irc_topic_notify.validate_config()
+        assert exc_info.value.code == 1
+
+    def test_trigger_phrases_empty_entry_exits(self, patch_config):
+        """An empty TRIGGER_PHRASES entry causes exit."""
+        import irc_topic_notify
+
+        irc_topic_notify.TRIGGER_PHRASES = ["BACK UP", ""]
+        with pytest.raises(SystemExit) as exc_info:
+            irc_topic_notify.validate_config()
+        assert exc_info.value.code == 1
+
+    def test_trigger_phrases_list_passes(self, patch_config):
+        """A list of non-empty phrases passes validation."""
+        import irc_topic_notify
+
+        irc_topic_notify.TRIGGER_PHRASES = ["BACK UP", "🟢"]
+        # Should not raise
+        irc_topic_notify.validate_config()
+
+    @pytest.mark.parametrize("phrases", [["BACK UP", 5], ["BACK UP", None], None])
+    def test_malformed_trigger_phrases_reported_not_raised(self, run_with_config, phrases):
+        """Bad TRIGGER_PHRASES survive import and fail validation with a config error."""
+        result = run_with_config(
+            "import irc_topic_notify; irc_topic_notify.validate_config()",
+            TRIGGER_PHRASES=phrases,
+        )
+
+        assert result.returncode == 1
+        assert "Traceback" not in result.stderr
+        assert "Config error: TRIGGER_PHRASES" in result.stderr
+
     def test_multiple_errors_all_reported(self, patch_config, caplog):
         """Multiple config errors are all logged before exit."""
         import irc_topic_notify
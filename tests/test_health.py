@@ -0,0 +1,132 @@
+"""Tests for the health check server."""
+
+from __future__ import annotations
+
+import errno
+import socket
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+
+
+@pytest.fixture
+def health_url(patch_config):
+    """Start the health server on a free port and return its base URL."""
+    import irc_topic_notify
+
+    sock = irc_topic_notify.start_health_server(0)
+    yield f"http://127.0.0.1:{sock.getsockname()[1]}"
+    # shutdown() wakes the accept() blocked in the server thread
+    sock.shutdown(socket.SHUT_RDWR)
+    sock.close()
+
+
+class TestHealthServer:
+    """Tests for health check responses."""
+
+    def test_ok_when_channel_joined(self, health_url):
+        """Returns 200 OK once the channel is joined."""
+        import irc_topic_notify
+
+        irc_topic_notify._channel_joined_event.set()
+
+        with urllib.request.urlopen(f"{health_url}/health", timeout=5) as resp:
+            assert resp.status == 200
+            assert resp.read() == b"OK"
+
+    def test_unavailable_when_not_joined(self, health_url):
+        """Returns 503 until the channel is joined."""
+        with pytest.raises(urllib.error.HTTPError) as exc_info:
+            urllib.request.urlopen(f"{health_url}/health", timeout=5)
+
+        assert exc_info.value.code == 503
+        assert exc_info.value.read() == b"Not connected"
+
+    def test_root_path_is_health(self, health_url):
+        """The root path serves the health check too."""
+        import irc_topic_notify
+
+        irc_topic_notify._channel_joined_event.set()
+
+        with urllib.request.urlopen(f"{health_url}/", timeout=5) as resp:
+            assert resp.status == 200
+
+    def test_unknown_path_not_found(self, health_url):
+        """Other paths return 404."""
+        with pytest.raises(urllib.error.HTTPError) as exc_info:
+            urllib.request.urlopen(f"{health_url}/metrics", timeout=5)
+
+        assert exc_info.value.code == 404
+
+    def test_stalled_client_does_not_block_probe(self, health_url):
+        """A client that connects and sends nothing can't outlast the probe timeout."""
+        import irc_topic_notify
+
+        irc_topic_notify._channel_joined_event.set()
+        port = int(health_url.rsplit(":", 1)[1])
+
+        with socket.create_connection(("127.0.0.1", port)):
+            start = time.monotonic()
+            with urllib.request.urlopen(f"{health_url}/health", timeout=5) as resp:
+                assert resp.status == 200
+            elapsed = time.monotonic() - start
+
+        # Well inside the Dockerfile HEALTHCHECK --timeout=5s
+        assert elapsed < 2.5
+
+
+class _FlakyListener:
+    """Listening socket stand-in: accept() raises the given errors, then reports closed."""
+
+    def __init__(self, *errors: OSError) -> None:
+        self.errors = list(errors)
+        self.closed = False
+
+    def accept(self):
+        if self.errors:
+            raise self.errors.pop(0)
+        self.closed = True
+        raise OSError(errno.EBADF, "Bad file descriptor")
+
+    def fileno(self) -> int:
+        return -1 if self.closed else 3
+
+
+class TestServeHealth:
+    """Tests for the accept loop's error handling."""
+
+    def test_transient_accept_errors_keep_serving(self, patch_config, monkeypatch, caplog):
+        """EMFILE and friends are logged and the loop carries on."""
+        import irc_topic_notify
+
+        monkeypatch.setattr(irc_topic_notify, "HEALTH_ACCEPT_RETRY_SECONDS", 0)
+        listener = _FlakyListener(
+            OSError(errno.EMFILE, "Too many open files"),
+            OSError(errno.ECONNABORTED, "Software caused connection abort"),
+        )
+
+        irc_topic_notify._serve_health(listener)
+
+        assert listener.errors == []
+        assert caplog.text.count("Health server accept failed") == 2
+
+    def test_closed_listener_stops_loop(self, patch_config, caplog):
+        """Closing the listening socket ends the loop without a warning."""
+        import irc_topic_notify
+
+        irc_topic_notify._serve_health(_FlakyListener())
+
+        assert "Health server accept failed" not in caplog.text
+
+
+class TestHealthResponse:
+    """Tests for request-line routing without a server."""
+
+    def test_garbage_request_not_found(self, patch_config):
+        """Unparseable requests get a 404 rather than an error."""
+        import irc_topic_notify
+
+        assert irc_topic_notify._health_response(b"") == irc_topic_notify._HEALTH_NOT_FOUND
+        assert irc_topic_notify._health_response(b"\x00\xff") == irc_topic_notify._HEALTH_NOT_FOUND
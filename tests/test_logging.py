@@ -0,0 +1,43 @@
+"""Tests for the queue-based logging setup done at import."""
+
+from __future__ import annotations
+
+import re
+
+# asctime - level - message, as set on the stderr handler
+LOG_LINE_RE = re.compile(r"^\d{4}-\d\d-\d\d \d\d:\d\d:\d\d,\d{3} - WARNING - record \d+$")
+
+
+class TestLoggingSetup:
+    """Tests for the QueueHandler/QueueListener wiring."""
+
+    def test_records_reach_stderr_formatted(self, run_with_config):
+        """With an unconfigured root logger, records are written to stderr by the listener."""
+        result = run_with_config(
+            "import irc_topic_notify as itn\n"
+            "print(itn._log_listener._thread is not None)\n"
+            "for i in range(200):\n"
+            "    itn.logger.warning('record %d', i)\n"
+        )
+
+        assert result.returncode == 0
+        assert result.stdout.strip() == "True"
+        lines = result.stderr.splitlines()
+        # Every queued record is flushed by the atexit handler before exit
+        assert len(lines) == 200
+        assert all(LOG_LINE_RE.match(line) for line in lines)
+
+    def test_listener_not_started_when_logging_configured(self, run_with_config):
+        """An importer's own logging config is left alone and the listener stays idle."""
+        result = run_with_config(
+            "import logging, sys\n"
+            "logging.basicConfig(stream=sys.stdout, format='OWN %(message)s', level=logging.INFO)\n"
+            "import irc_topic_notify as itn\n"
+            "print(itn._log_listener._thread is None)\n"
+            "itn.logger.warning('record 0')\n"
+        )
+
+        assert result.returncode == 0
+        assert result.stdout.splitlines() == ["True", "OWN record 0"]
+        # No stray listener output, and no atexit error from stopping an idle listener
+        assert result.stderr == ""
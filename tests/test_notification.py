@@ -2,102 +2,188 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+import irc_topic_notify as itn
 
-import pytest
+# Payload fields derived from the mock config in conftest. The fake decodes
+# the form body, so every value comes back as a string.
+EXPECTED_BASE = {
+    "token": "abc123token",
+    "user": "xyz789user",
+    "title": "Test Alert",
+    "message": "Test message",
+    "url": "https://example.com",
+    "url_title": "Click here",
+}
 
 
-class TestSendPushoverNotification:
-    """Tests for the send_pushover_notification function."""
+# Tests for the send_pushover_notification function
+def test_successful_notification(mock_requests_post):
+    """Successful notification returns True."""
+    result = itn.send_pushover_notification()
 
-    def test_successful_notification(self, mock_requests_post):
-        """Successful notification returns True."""
-        import irc_topic_notify
+    assert result is True
+    assert len(mock_requests_post.calls) == 1
 
-        result = irc_topic_notify.send_pushover_notification()
 
-        assert result is True
-        mock_requests_post.assert_called_once()
+def test_notification_sends_correct_data(mock_requests_post):
+    """Notification sends correct data to Pushover API."""
+    itn.send_pushover_notification()
 
-    def test_notification_sends_correct_data(self, mock_requests_post):
-        """Notification sends correct data to Pushover API."""
-        import irc_topic_notify
+    call = mock_requests_post.calls[-1]
+    assert call.url == "https://api.pushover.net/1/messages.json"
+    assert call.data == {**EXPECTED_BASE, "priority": "1", "sound": "persistent"}
 
-        irc_topic_notify.send_pushover_notification()
 
-        call_args = mock_requests_post.call_args
-        assert call_args[0][0] == "https://api.pushover.net/1/messages.json"
+def test_custom_title_and_message(mock_requests_post):
+    """Custom title and message override defaults."""
+    itn.send_pushover_notification(title="Custom Title", message="Custom Message")
 
-        data = call_args[1]["data"]
-        assert data["token"] == "abc123token"
-        assert data["user"] == "xyz789user"
-        assert data["title"] == "Test Alert"
-        assert data["message"] == "Test message"
+    expected = {"title": "Custom Title", "message": "Custom Message"}
+    data = mock_requests_post.calls[-1].data
+    assert {k: data[k] for k in expected} == expected
 
-    def test_custom_title_and_message(self, mock_requests_post):
-        """Custom title and message override defaults."""
-        import irc_topic_notify
 
-        irc_topic_notify.send_pushover_notification(title="Custom Title", message="Custom Message")
+def test_test_mode_uses_normal_priority(mock_requests_post):
+    """Test mode uses normal priority (0) instead of high (1)."""
+    itn.send_pushover_notification(test=True)
 
-        data = mock_requests_post.call_args[1]["data"]
-        assert data["title"] == "Custom Title"
-        assert data["message"] == "Custom Message"
+    expected = {"priority": "0", "sound": "pushover"}
+    data = mock_requests_post.calls[-1].data
+    assert {k: data[k] for k in expected} == expected
 
-    def test_test_mode_uses_normal_priority(self, mock_requests_post):
-        """Test mode uses normal priority (0) instead of high (1)."""
-        import irc_topic_notify
 
-        irc_topic_notify.send_pushover_notification(test=True)
+def test_normal_mode_uses_high_priority(mock_requests_post):
+    """Normal mode uses high priority (1)."""
+    itn.send_pushover_notification(test=False)
 
-        data = mock_requests_post.call_args[1]["data"]
-        assert data["priority"] == 0
-        assert data["sound"] == "pushover"
+    expected = {"priority": "1", "sound": "persistent"}
+    data = mock_requests_post.calls[-1].data
+    assert {k: data[k] for k in expected} == expected
 
-    def test_normal_mode_uses_high_priority(self, mock_requests_post):
-        """Normal mode uses high priority (1)."""
-        import irc_topic_notify
 
-        irc_topic_notify.send_pushover_notification(test=False)
+def test_failed_notification_returns_false(mock_requests_post_failure):
+    """Failed notification (non-200 status) returns False."""
+    result = itn.send_pushover_notification()
 
-        data = mock_requests_post.call_args[1]["data"]
-        assert data["priority"] == 1
-        assert data["sound"] == "persistent"
+    assert result is False
 
-    def test_failed_notification_returns_false(self, mock_requests_post_failure):
-        """Failed notification (non-200 status) returns False."""
-        import irc_topic_notify
 
-        result = irc_topic_notify.send_pushover_notification()
+def test_network_error_returns_false(fake_post):
+    """Network error returns False and doesn't raise."""
+    fake_post(exc=Exception("Connection refused"))
 
-        assert result is False
+    result = itn.send_pushover_notification()
 
-    def test_network_error_returns_false(self, patch_config):
-        """Network error returns False and doesn't raise."""
-        import irc_topic_notify
+    assert result is False
 
-        with patch.object(irc_topic_notify.requests, "post") as mock_post:
-            mock_post.side_effect = Exception("Connection refused")
 
-            result = irc_topic_notify.send_pushover_notification()
+def test_timeout_is_set(mock_requests_post):
+    """Request includes a timeout."""
+    itn.send_pushover_notification()
 
-            assert result is False
+    assert mock_requests_post.calls[-1].timeout == (5, 30)
 
-    def test_timeout_is_set(self, mock_requests_post):
-        """Request includes a timeout."""
-        import irc_topic_notify
 
-        irc_topic_notify.send_pushover_notification()
+def test_url_included_in_notification(mock_requests_post):
+    """URL and URL title are included in notification."""
+    itn.send_pushover_notification()
 
-        call_args = mock_requests_post.call_args
-        assert call_args[1]["timeout"] == 30
+    expected = {"url": "https://example.com", "url_title": "Click here"}
+    data = mock_requests_post.calls[-1].data
+    assert {k: data[k] for k in expected} == expected
 
-    def test_url_included_in_notification(self, mock_requests_post):
-        """URL and URL title are included in notification."""
-        import irc_topic_notify
 
-        irc_topic_notify.send_pushover_notification()
+def test_session_is_reused(mock_requests_post):
+    """Notifications go through the shared keep-alive session."""
+    itn.send_pushover_notification()
+    itn.send_pushover_notification()
 
-        data = mock_requests_post.call_args[1]["data"]
-        assert data["url"] == "https://example.com"
-        assert data["url_title"] == "Click here"
+    assert len(mock_requests_post.calls) == 2
+    user_agent = itn._SESSION.headers["User-Agent"]
+    assert user_agent == f"irc-topic-notify/{itn.__version__}"
+
+
+def test_prepared_request_template_untouched(mock_requests_post):
+    """Each send fills a copy, leaving the shared prepared request empty."""
+    itn.send_pushover_notification()
+
+    assert itn._PUSHOVER_REQUEST.body is None
+
+
+def test_session_retries_connect_errors_only(patch_config):
+    """Connect failures are retried; read/status failures are not."""
+    retries = itn._SESSION.get_adapter("https://api.pushover.net").max_retries
+
+    assert retries.connect == 2
+    assert retries.read == 0
+    assert retries.status == 0
+
+
+def test_local_rate_limit_blocks_burst(mock_requests_post):
+    """Sends beyond the burst capacity are refused without a request."""
+    burst = itn.PUSHOVER_RATE_LIMIT_BURST
+    results = [itn.send_pushover_notification() for _ in range(burst + 1)]
+
+    assert results == [True] * burst + [False]
+    assert len(mock_requests_post.calls) == burst
+
+
+def test_429_pauses_further_sends(fake_post):
+    """A 429 response honours Retry-After before sending again."""
+    fake = fake_post(status_code=429, text="", headers={"Retry-After": "120"})
+
+    assert itn.send_pushover_notification() is False
+    assert itn.send_pushover_notification() is False
+
+    assert len(fake.calls) == 1
+
+
+def test_concurrent_send_is_skipped(mock_requests_post):
+    """A send while another is in flight returns False without posting."""
+    with itn._notify_lock:
+        result = itn.send_pushover_notification()
+
+    assert result is False
+    assert mock_requests_post.calls == []
+    assert itn.send_pushover_notification() is True
+
+
+# Tests for the client-side rate limiter
+def test_refills_over_time(patch_config):
+    """Tokens refill at the configured rate."""
+    bucket = itn._TokenBucket(capacity=1, refill_per_second=1.0)
+    assert bucket.try_acquire() is True
+    assert bucket.try_acquire() is False
+
+    bucket.updated -= 1.0
+    assert bucket.try_acquire() is True
+
+
+def test_pause_refuses_tokens(patch_config):
+    """Paused bucket refuses tokens even when full."""
+    bucket = itn._TokenBucket(capacity=5, refill_per_second=1.0)
+    bucket.pause(60)
+
+    assert bucket.try_acquire() is False
+
+
+def test_wait_seconds_until_next_token(patch_config):
+    """wait_seconds reports the refill or pause time left."""
+    bucket = itn._TokenBucket(capacity=1, refill_per_second=1.0)
+    assert bucket.wait_seconds() == 0.0
+
+    bucket.try_acquire()
+    assert 0.0 < bucket.wait_seconds() <= 1.0
+
+    bucket.pause(60)
+    assert 59.0 < bucket.wait_seconds() <= 60.0
+
+
+def test_retry_after_falls_back_to_default(patch_config):
+    """Missing or non-numeric Retry-After uses the default; huge values are clamped."""
+    default = itn.PUSHOVER_RETRY_AFTER_DEFAULT
+    assert itn._parse_retry_after(None) == default
+    assert itn._parse_retry_after("soon") == default
+    assert itn._parse_retry_after("nan") == default
+    assert itn._parse_retry_after("30") == 30.0
+    assert itn._parse_retry_after("inf") == itn.PUSHOVER_RETRY_AFTER_MAX
@@ -1,128 +1,160 @@
-"""Tests for trigger phrase detection."""
+"""Tests for trigger phrase detection.
 
-from __future__ import annotations
+PYTEST_DONT_REWRITE: plain asserts keep collection of these cheap checks fast.
+"""
 
-from unittest.mock import patch
+from __future__ import annotations
 
 import pytest
 
+import irc_topic_notify as itn
 
-class TestCheckTrigger:
-    """Tests for the check_trigger function."""
-
-    def test_trigger_found_exact_match(self, patch_config):
-        """Trigger phrase is found when it matches exactly."""
-        import irc_topic_notify
-
-        assert irc_topic_notify.check_trigger("Server: ONLINE") is True
-
-    def test_trigger_found_at_start(self, patch_config):
-        """Trigger phrase is found at the start of topic."""
-        import irc_topic_notify
 
-        assert irc_topic_notify.check_trigger("ONLINE - all systems go") is True
+# Tests for the check_trigger function (case-sensitive, the default)
+@pytest.mark.parametrize("topic,expected", [
+    ("Server: ONLINE", True),
+    ("ONLINE - all systems go", True),
+    ("Server is now ONLINE", True),
+    ("ONLINE", True),
+    ("Server: OFFLINE", False),
+    ("Server: online", False),
+    ("Server: Online", False),
+    ("", False),
+])
+def test_check_trigger(patch_config, topic, expected):
+    assert itn.check_trigger(topic) is expected
 
-    def test_trigger_found_at_end(self, patch_config):
-        """Trigger phrase is found at the end of topic."""
-        import irc_topic_notify
 
-        assert irc_topic_notify.check_trigger("Server is now ONLINE") is True
+# Tests for case-insensitive trigger matching
+@pytest.mark.parametrize("topic,expected", [
+    ("Server: online", True),
+    ("Server: Online Now", True),
+    ("Server: ONLINE", True),
+    ("Server: OFFLINE", False),
+])
+def test_check_trigger_case_insensitive(patch_config, topic, expected):
+    itn.TRIGGER_CASE_SENSITIVE = False
+    assert itn.check_trigger(topic) is expected
 
-    def test_trigger_not_found(self, patch_config):
-        """Trigger phrase is not found when absent."""
-        import irc_topic_notify
 
-        assert irc_topic_notify.check_trigger("Server: OFFLINE") is False
+def test_trigger_casefold_matches(patch_config):
+    """Case-insensitive mode uses full case folding (ß == ss)."""
+    itn.TRIGGER_CASE_SENSITIVE = False
+    itn.TRIGGER_PHRASE = "STRASSE"
+    itn._compile_triggers()
+    assert itn.check_trigger("Hauptstraße ist offen") is True
 
-    def test_trigger_case_sensitive_no_match(self, patch_config):
-        """Case-sensitive mode doesn't match different case."""
-        import irc_topic_notify
 
-        # TRIGGER_PHRASE is "ONLINE", should not match "online"
-        assert irc_topic_notify.check_trigger("Server: online") is False
+# Tests for additional phrases configured via TRIGGER_PHRASES
+def test_additional_phrase_matches(patch_config):
+    """Any additional phrase triggers."""
+    itn.TRIGGER_PHRASES = ["BACK UP", "🟢"]
+    itn._compile_triggers()
+    assert itn.check_trigger("Server is BACK UP") is True
+    assert itn.check_trigger("Status: 🟢") is True
 
-    def test_trigger_case_sensitive_partial_match(self, patch_config):
-        """Case-sensitive mode doesn't match partial case differences."""
-        import irc_topic_notify
 
-        assert irc_topic_notify.check_trigger("Server: Online") is False
+def test_primary_phrase_still_matches(patch_config):
+    """TRIGGER_PHRASE keeps matching alongside additional phrases."""
+    itn.TRIGGER_PHRASES = ["BACK UP"]
+    itn._compile_triggers()
+    assert itn.check_trigger("Server: ONLINE") is True
 
-    def test_trigger_empty_topic(self, patch_config):
-        """Empty topic doesn't trigger."""
-        import irc_topic_notify
 
-        assert irc_topic_notify.check_trigger("") is False
+def test_no_phrase_found(patch_config):
+    """Topic containing none of the phrases doesn't trigger."""
+    itn.TRIGGER_PHRASES = ["BACK UP"]
+    itn._compile_triggers()
+    assert itn.check_trigger("Server: OFFLINE") is False
 
-    def test_trigger_phrase_only(self, patch_config):
-        """Topic containing only the trigger phrase matches."""
-        import irc_topic_notify
 
-        assert irc_topic_notify.check_trigger("ONLINE") is True
+def test_additional_phrase_case_insensitive(patch_config):
+    """Additional phrases honour case-insensitive mode."""
+    itn.TRIGGER_CASE_SENSITIVE = False
+    itn.TRIGGER_PHRASES = ["BACK UP"]
+    itn._compile_triggers()
+    assert itn.check_trigger("server is back up") is True
 
 
-class TestCheckTriggerCaseInsensitive:
-    """Tests for case-insensitive trigger matching."""
+def test_malformed_phrases_skipped(patch_config):
+    """Bad TRIGGER_PHRASES entries are skipped rather than raising or matching everything."""
+    itn.TRIGGER_PHRASES = ["BACK UP", 5, None, ""]
+    itn._compile_triggers()
+    assert itn.check_trigger("Server is BACK UP") is True
+    assert itn.check_trigger("Server: OFFLINE") is False
 
-    def test_trigger_lowercase_matches(self, patch_config):
-        """Lowercase trigger phrase matches in case-insensitive mode."""
-        import irc_topic_notify
+    itn.TRIGGER_PHRASES = "BACK UP"
+    itn._compile_triggers()
+    assert itn.check_trigger("Server: OFFLINE") is False
 
-        irc_topic_notify.TRIGGER_CASE_SENSITIVE = False
-        assert irc_topic_notify.check_trigger("Server: online") is True
 
-    def test_trigger_mixed_case_matches(self, patch_config):
-        """Mixed case trigger phrase matches in case-insensitive mode."""
-        import irc_topic_notify
+# Tests for find_trigger match reporting
+def test_reports_phrase_and_offset(patch_config):
+    """Returns the matched phrase and its position."""
+    assert itn.find_trigger("Server: ONLINE") == ("ONLINE", 8)
 
-        irc_topic_notify.TRIGGER_CASE_SENSITIVE = False
-        assert irc_topic_notify.check_trigger("Server: Online Now") is True
 
-    def test_trigger_uppercase_still_matches(self, patch_config):
-        """Uppercase still matches in case-insensitive mode."""
-        import irc_topic_notify
+def test_no_match_returns_none(patch_config):
+    """Returns None when no phrase is present."""
+    assert itn.find_trigger("Server: OFFLINE") is None
 
-        irc_topic_notify.TRIGGER_CASE_SENSITIVE = False
-        assert irc_topic_notify.check_trigger("Server: ONLINE") is True
 
-    def test_trigger_not_found_still_fails(self, patch_config):
-        """Non-matching text still fails in case-insensitive mode."""
-        import irc_topic_notify
+def test_reports_original_phrase_case_insensitive(patch_config):
+    """Case-insensitive matches report the phrase as configured."""
+    itn.TRIGGER_CASE_SENSITIVE = False
+    itn.TRIGGER_PHRASES = ["Back Up"]
+    itn._compile_triggers()
+    assert itn.find_trigger("we are back up") == ("Back Up", 7)
 
-        irc_topic_notify.TRIGGER_CASE_SENSITIVE = False
-        assert irc_topic_notify.check_trigger("Server: OFFLINE") is False
 
+# Tests for memoized trigger results
+def test_repeated_topic_uses_cache(patch_config):
+    """Checking the same topic twice scans it only once."""
+    itn._find_trigger.cache_clear()
+    itn.check_trigger("Server: ONLINE")
+    itn.check_trigger("Server: ONLINE")
+
+    info = itn._find_trigger.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
 
-class TestTriggerEdgeCases:
-    """Edge case tests for trigger detection."""
 
-    def test_trigger_with_unicode(self, patch_config):
-        """Trigger works with unicode in topic."""
-        import irc_topic_notify
+def test_cache_keyed_on_case_sensitivity(patch_config):
+    """Toggling case sensitivity never returns a stale cached result."""
+    assert itn.check_trigger("Server: online") is False
 
-        assert irc_topic_notify.check_trigger("🟢 ONLINE 🟢") is True
+    itn.TRIGGER_CASE_SENSITIVE = False
+    assert itn.check_trigger("Server: online") is True
 
-    def test_trigger_with_special_chars(self, patch_config):
-        """Trigger works with special characters around it."""
-        import irc_topic_notify
 
-        assert irc_topic_notify.check_trigger("[STATUS] ONLINE!!!") is True
+def test_recompiling_triggers_invalidates_cache(patch_config):
+    """Changing the phrases discards cached results."""
+    assert itn.check_trigger("Server is BACK UP") is False
 
-    def test_trigger_substring_matches(self, patch_config):
-        """Trigger matches as substring (e.g., ONLINEMODE contains ONLINE)."""
-        import irc_topic_notify
+    itn.TRIGGER_PHRASES = ["BACK UP"]
+    itn._compile_triggers()
 
-        # This is expected behaviour - substring matching
-        assert irc_topic_notify.check_trigger("ONLINEMODE enabled") is True
+    assert itn.check_trigger("Server is BACK UP") is True
 
-    def test_trigger_very_long_topic(self, patch_config):
-        """Trigger works in very long topics."""
-        import irc_topic_notify
 
-        long_topic = "x" * 1000 + " ONLINE " + "y" * 1000
-        assert irc_topic_notify.check_trigger(long_topic) is True
+# Edge case tests for trigger detection
+@pytest.mark.parametrize("topic,case_sensitive,expected", [
+    ("🟢 ONLINE 🟢", True, True),
+    ("[STATUS] ONLINE!!!", True, True),
+    # Substring matching is expected behaviour
+    ("ONLINEMODE enabled", True, True),
+    ("x" * 1000 + " ONLINE " + "y" * 1000, True, True),
+    ("   \t\n  ", True, False),
+    # Shorter than every phrase
+    ("ONLIN", False, False),
+])
+def test_edge_cases(patch_config, topic, case_sensitive, expected):
+    itn.TRIGGER_CASE_SENSITIVE = case_sensitive
+    assert itn.check_trigger(topic) is expected
 
-    def test_trigger_whitespace_only(self, patch_config):
-        """Whitespace-only topic doesn't trigger."""
-        import irc_topic_notify
 
-        assert irc_topic_notify.check_trigger("   \t\n  ") is False
+def test_trigger_short_topic_can_grow_when_folded(patch_config):
+    """Length guard doesn't reject non-ASCII topics that lengthen when folded."""
+    itn.TRIGGER_CASE_SENSITIVE = False
+    itn.TRIGGER_PHRASE = "STRASSE"
+    itn._compile_triggers()
+    assert itn.check_trigger("straße") is True